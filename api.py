@@ -5,27 +5,166 @@ LocalAIHub Server
 A simple local REST API for running AI language models offline.
 """
 
+import sys
+
+# Patch the standard library before anything opens sockets, so Ollama calls
+# yield to other requests instead of blocking the whole server
+if "--use-gevent" in sys.argv:
+    from gevent import monkey
+    monkey.patch_all()
+
 import os
-import json
+import re
+import atexit
+import argparse
 import time
+import queue
+import hashlib
+import threading
+import collections
 import psutil
+import orjson
 import requests
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, request, jsonify
-from typing import Dict, Any, Optional
+from flask import Flask, Response, request, stream_with_context
+from flask_compress import Compress
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, Optional
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to plain keyword sets
+    ahocorasick = None
 
 # Setup
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
 DEFAULT_AI_MODEL = "llama2"  # Backup model if none specified
 LOG_FOLDER = Path("logs")
 LOG_FILE = LOG_FOLDER / "ai_hub_log.jsonl"
+CACHE_MAX_ENTRIES = 512  # Most recent Ollama answers kept in memory
+LOG_BATCH_SIZE = 64  # Most log lines pulled off the queue in one go
+LOG_BUFFER_BYTES = 1 << 16  # Write to disk once this much is waiting...
+LOG_FLUSH_INTERVAL = 0.5  # ...or after this many seconds
+LOG_MAX_BYTES = 100 * (1 << 20)  # Rotate the log file past this size
+LOG_BACKUP_COUNT = 3  # Rotated log files to keep
+LOG_QUEUE_SIZE = 10000  # Pending log lines before new ones are dropped
+LOG_SHUTDOWN_TIMEOUT = 5.0  # Seconds to wait for the log writer to finish on exit
+STATUS_CACHE_SECONDS = 1.0  # How long a /status snapshot is reused
+HEALTH_REFRESH_SECONDS = 1.0  # How often the /health timestamp is updated
+OLLAMA_POLL_SECONDS = 5.0  # How often to check whether Ollama is up
 
 # Create logs folder if it doesn't exist
 LOG_FOLDER.mkdir(exist_ok=True)
 
 app = Flask(__name__)
 
+# Gzip larger JSON answers; level 1 is fast and still shrinks prose a lot
+app.config.update(
+    COMPRESS_MIMETYPES=["application/json"],
+    COMPRESS_ALGORITHM=["gzip", "deflate"],
+    COMPRESS_MIN_SIZE=512,
+    COMPRESS_LEVEL=1,
+    COMPRESS_STREAMS=False
+)
+Compress(app)
+
+def fastjson(obj: Any, status: int = 200):
+    """Builds a JSON response using orjson instead of Flask's jsonify."""
+    body = obj if isinstance(obj, bytes) else orjson.dumps(obj, option=orjson.OPT_UTC_Z)
+    return app.response_class(
+        body,
+        status=status,
+        mimetype="application/json"
+    )
+
+def _iso_timestamp(time_ns: int) -> str:
+    """Formats nanoseconds since the epoch as a UTC ISO 8601 string."""
+    seconds, nanos = divmod(time_ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{nanos // 1_000_000:03d}Z"
+
+# Keywords used to pick a fallback reply when Ollama isn't available
+_WORD_PATTERN = re.compile(r"[a-z]+")
+_GREETINGS = frozenset({"hello", "hi", "hey"})
+_IDENTITY = frozenset({"who"})
+_IDENTITY_PHRASES = ("what are you",)
+_HELP = frozenset({"help"})
+_HELP_PHRASES = ("what can you do",)
+_TIME = frozenset({"time"})
+
+# Replies that never change, built once at startup
+_GREETING_REPLY = f"Hi there! I'm your local AI ({DEFAULT_AI_MODEL}) running offline on your computer."
+_IDENTITY_REPLY = f"I'm LocalAIHub, your offline AI assistant using the {DEFAULT_AI_MODEL} model."
+_HELP_REPLY = "I can answer questions and help with tasks, all offline for privacy and speed."
+
+def _current_time(user_input: str) -> str:
+    return f"It's currently {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}."
+
+def _default_reply(user_input: str) -> str:
+    return f"I'm your offline AI ({DEFAULT_AI_MODEL}). You said: '{user_input[:50]}...' - I'm handling this locally for privacy."
+
+# Checked in order; the first rule whose keywords or phrases appear wins.
+# A reply is either a fixed string or a function that builds one.
+_RULES = (
+    (_GREETINGS, (), _GREETING_REPLY),
+    (_IDENTITY, _IDENTITY_PHRASES, _IDENTITY_REPLY),
+    (_HELP, _HELP_PHRASES, _HELP_REPLY),
+    (_TIME, (), _current_time),
+)
+
+# Inputs shorter than the shortest keyword can't match any rule
+_MIN_KEYWORD_LENGTH = min(len(word) for word in _GREETINGS | _IDENTITY | _HELP | _TIME)
+
+def _is_letter(char: str) -> bool:
+    return "a" <= char <= "z"
+
+def _build_automaton():
+    """Compiles every keyword and phrase into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for index, (keywords, phrases, _) in enumerate(_RULES):
+        for word in keywords:
+            automaton.add_word(word, (index, len(word), True))
+        for phrase in phrases:
+            automaton.add_word(phrase, (index, len(phrase), False))
+    automaton.make_automaton()
+    return automaton
+
+def _find_reply_with_automaton(input_lower: str):
+    """Finds the first matching rule's reply in a single pass over the text."""
+    best = None
+    for end, (index, length, whole_word) in _AUTOMATON.iter(input_lower):
+        # Keywords only count as whole words, same as the keyword-set check
+        if whole_word:
+            start = end - length + 1
+            if start > 0 and _is_letter(input_lower[start - 1]):
+                continue
+            if end + 1 < len(input_lower) and _is_letter(input_lower[end + 1]):
+                continue
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return None if best is None else _RULES[best][2]
+
+def _find_reply_with_sets(input_lower: str):
+    """Finds the first matching rule's reply using keyword sets."""
+    tokens = set(_WORD_PATTERN.findall(input_lower))
+    for keywords, phrases, reply in _RULES:
+        if tokens & keywords or any(phrase in input_lower for phrase in phrases):
+            return reply
+    return None
+
+if ahocorasick is not None:
+    _AUTOMATON = _build_automaton()
+    _find_reply = _find_reply_with_automaton
+else:
+    _find_reply = _find_reply_with_sets
+
+# Queued by _stop_log_worker to tell the log writer to flush and exit
+_LOG_STOP = object()
+
 class LocalAIHub:
     """Handles local AI model interactions and logging."""
     
@@ -33,10 +172,42 @@ class LocalAIHub:
         self.start_time = time.time()
         self.total_requests = 0
         
+        # Keep one connection pool to Ollama so each request skips the TCP handshake
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        ))
+        
+        # Remember recent answers so repeated prompts skip Ollama entirely
+        self._cache = collections.OrderedDict()
+        self._cache_max = CACHE_MAX_ENTRIES
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Hand log lines to a background writer so requests never wait on disk
+        self._log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+        atexit.register(self._stop_log_worker)
+        
+        # Reuse the last status snapshot so bursts of /status polls stay cheap
+        self._status_cache = (0.0, None)
+        self._status_lock = threading.Lock()
+        
+        # Track whether Ollama is up in the background; assume it is until checked
+        self._ollama_up = True
+        threading.Thread(target=self._poll_ollama_forever, daemon=True).start()
+        
+        # Load the default model early so the first real request doesn't wait for it
+        threading.Thread(target=self._warmup, daemon=True).start()
+        
     def _save_interaction(self, user_input: str, ai_response: str, model: str, time_taken: float, error: Optional[str] = None):
         """Saves the user input and AI response to a log file."""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time_ns(),  # Formatted by the log writer
             "user_input": user_input,
             "ai_response": ai_response,
             "model": model,
@@ -46,13 +217,161 @@ class LocalAIHub:
         }
         
         try:
-            with open(LOG_FILE, "a", encoding="utf-8") as file:
-                file.write(json.dumps(log_entry) + "\n")
+            self._log_q.put_nowait(log_entry)
+        except queue.Full:
+            print("Could not save log: too many pending log entries")
+    
+    def _log_worker(self):
+        """Writes queued log entries to the log file in batches."""
+        fd = None  # Opened on the first write and reopened after any failure
+        pending = bytearray()
+        last_write = time.monotonic()
+        stopping = False
+        while True:
+            if pending and fd is None:
+                # The log can't be opened right now; leave new entries in the
+                # bounded queue and retry shortly instead of growing this buffer
+                batch = []
+                time.sleep(LOG_FLUSH_INTERVAL)
+            else:
+                try:
+                    batch = [self._log_q.get(timeout=LOG_FLUSH_INTERVAL)]
+                    
+                    # Grab whatever else is waiting so it goes out in one write
+                    while len(batch) < LOG_BATCH_SIZE:
+                        try:
+                            batch.append(self._log_q.get_nowait())
+                        except queue.Empty:
+                            break
+                except queue.Empty:
+                    batch = []
+            
+            for entry in batch:
+                if entry is _LOG_STOP:
+                    stopping = True
+                    continue
+                pending += self._serialize_log_entry(entry)
+            
+            if pending and (stopping or fd is None or len(pending) >= LOG_BUFFER_BYTES
+                            or time.monotonic() - last_write >= LOG_FLUSH_INTERVAL):
+                fd = self._write_log(fd, pending)
+                last_write = time.monotonic()
+            
+            if stopping:
+                return
+    
+    def _serialize_log_entry(self, entry: Dict[str, Any]) -> bytes:
+        """Turns one log entry into a JSON line, or nothing if it can't be encoded."""
+        try:
+            entry["timestamp"] = _iso_timestamp(entry["timestamp"])
+            return orjson.dumps(entry) + b"\n"
         except Exception as e:
             print(f"Could not save log: {e}")
+            return b""
+    
+    def _write_log(self, fd: Optional[int], pending: bytearray) -> Optional[int]:
+        """Writes out pending, rotating the log when full.
+        
+        Returns the fd to use next, or None if the log isn't open; anything
+        that couldn't be written stays in pending for the next attempt.
+        """
+        if fd is None:
+            try:
+                fd = self._open_log()
+            except OSError as e:
+                print(f"Could not open log file: {e}")
+                return None
+        
+        try:
+            while pending:
+                del pending[:os.write(fd, pending)]
+            if os.fstat(fd).st_size > LOG_MAX_BYTES:
+                return self._rotate_log(fd)
+        except OSError as e:
+            print(f"Could not save log: {e}")
+            self._close_log(fd)
+            return None
+        return fd
+    
+    def _stop_log_worker(self):
+        """Lets the log writer flush everything still waiting before the process exits."""
+        try:
+            self._log_q.put(_LOG_STOP, timeout=LOG_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            return
+        self._log_thread.join(timeout=LOG_SHUTDOWN_TIMEOUT)
+    
+    def _open_log(self) -> int:
+        """Opens the log file for appending and returns its file descriptor."""
+        return os.open(str(LOG_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def _close_log(self, fd: int) -> None:
+        """Closes a log file descriptor, ignoring errors."""
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    
+    def _rotate_log(self, fd: int) -> Optional[int]:
+        """Moves a full log aside as ai_hub_log.jsonl.1, .2, ... and starts a fresh one.
+        
+        Always closes fd; returns the new fd, or None if the fresh log can't be opened.
+        """
+        # Another worker may have rotated (or removed) the file already; if so just reopen
+        try:
+            rotated_elsewhere = os.stat(LOG_FILE).st_ino != os.fstat(fd).st_ino
+        except OSError:
+            rotated_elsewhere = True
+        self._close_log(fd)
+        
+        if not rotated_elsewhere:
+            try:
+                for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+                    older = LOG_FILE.with_name(f"{LOG_FILE.name}.{index}")
+                    if older.exists():
+                        os.rename(older, LOG_FILE.with_name(f"{LOG_FILE.name}.{index + 1}"))
+                os.rename(LOG_FILE, LOG_FILE.with_name(f"{LOG_FILE.name}.1"))
+            except OSError as e:
+                print(f"Could not rotate log: {e}")
+        
+        try:
+            return self._open_log()
+        except OSError as e:
+            print(f"Could not open log file: {e}")
+            return None
+    
+    def _warmup(self):
+        """Opens a connection to Ollama and loads the default model."""
+        try:
+            self.session.get(OLLAMA_TAGS_URL, timeout=5)
+            self.session.post(
+                OLLAMA_API_URL,
+                json={
+                    "model": DEFAULT_AI_MODEL,
+                    "prompt": "hi",
+                    "stream": False,
+                    "options": {"num_predict": 1}
+                },
+                timeout=60
+            )
+        except Exception:
+            pass  # Ollama may not be running yet; requests will fall back as usual
+    
+    def _poll_ollama_forever(self):
+        """Checks every few seconds whether Ollama is reachable."""
+        while True:
+            try:
+                self._ollama_up = self.session.get(OLLAMA_TAGS_URL, timeout=2).status_code == 200
+            except Exception:
+                self._ollama_up = False
+            time.sleep(OLLAMA_POLL_SECONDS)
     
     def _query_ollama(self, user_input: str, model: str = DEFAULT_AI_MODEL) -> tuple[str, Optional[str]]:
         """Sends a request to the Ollama API to generate a response."""
+        # Skip straight to the fallback rather than waiting on a dead server
+        if not self._ollama_up:
+            return None, "Ollama isn't running - please start it!"
+        
         try:
             request_data = {
                 "model": model,
@@ -60,55 +379,133 @@ class LocalAIHub:
                 "stream": False
             }
             
-            response = requests.post(
+            response = self.session.post(
                 OLLAMA_API_URL,
                 json=request_data,
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                self._ollama_up = True
+                result = orjson.loads(response.content)
                 return result.get("response", "No response generated"), None
             else:
                 return None, f"Ollama API error: {response.status_code}"
                 
         except requests.exceptions.ConnectionError:
+            # Don't wait for the next poll to stop sending requests to a dead server
+            self._ollama_up = False
             return None, "Ollama isn't running - please start it!"
         except requests.exceptions.Timeout:
             return None, "Request took too long"
         except Exception as e:
             return None, f"Something went wrong: {str(e)}"
     
-    def _create_fallback_response(self, user_input: str) -> str:
+    def _stream_ollama(self, user_input: str, model: str = DEFAULT_AI_MODEL) -> Iterator[tuple[Optional[str], Optional[str]]]:
+        """Yields (text, None) pieces from Ollama as they arrive, or (None, error) if it fails."""
+        if not self._ollama_up:
+            yield None, "Ollama isn't running - please start it!"
+            return
+        
+        try:
+            request_data = {
+                "model": model,
+                "prompt": user_input,
+                "stream": True
+            }
+            
+            with self.session.post(
+                OLLAMA_API_URL,
+                json=request_data,
+                stream=True,
+                timeout=(3, 300)
+            ) as response:
+                if response.status_code != 200:
+                    yield None, f"Ollama API error: {response.status_code}"
+                    return
+                self._ollama_up = True
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"], None
+                    if chunk.get("done"):
+                        return
+                    
+        except requests.exceptions.ConnectionError:
+            self._ollama_up = False
+            yield None, "Ollama isn't running - please start it!"
+        except requests.exceptions.Timeout:
+            yield None, "Request took too long"
+        except Exception as e:
+            yield None, f"Something went wrong: {str(e)}"
+    
+    def _create_fallback_response(self, user_input: str, normalized: Optional[str] = None) -> str:
         """Generates a simple response when Ollama isn't available."""
-        input_lower = user_input.lower()
-        
-        if any(word in input_lower for word in ["hello", "hi", "hey"]):
-            return f"Hi there! I'm your local AI ({DEFAULT_AI_MODEL}) running offline on your computer."
-        elif any(word in input_lower for word in ["who", "what are you"]):
-            return f"I'm LocalAIHub, your offline AI assistant using the {DEFAULT_AI_MODEL} model."
-        elif any(word in input_lower for word in ["help", "what can you do"]):
-            return "I can answer questions and help with tasks, all offline for privacy and speed."
-        elif "time" in input_lower:
-            return f"It's currently {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}."
-        else:
-            return f"I'm your offline AI ({DEFAULT_AI_MODEL}). You said: '{user_input[:50]}...' - I'm handling this locally for privacy."
+        if len(user_input) < _MIN_KEYWORD_LENGTH:
+            return _default_reply(user_input)
+        
+        if normalized is None:
+            normalized = user_input.strip().casefold()
+        reply = _find_reply(normalized)
+        if reply is None:
+            return _default_reply(user_input)
+        return reply(user_input) if callable(reply) else reply
+    
+    def _cache_key(self, normalized: str, model: str) -> bytes:
+        """Builds a compact cache key for a model and normalized prompt pair."""
+        # surrogatepass keeps odd but valid JSON strings (lone surrogates) hashable
+        key = f"{model}\0{normalized}".encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(key, digest_size=16).digest()
+    
+    def _get_cached_response(self, key: bytes) -> Optional[str]:
+        """Returns a cached answer and marks it as recently used."""
+        with self._cache_lock:
+            response = self._cache.get(key)
+            if response is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return response
+    
+    def _store_cached_response(self, key: bytes, response: str) -> None:
+        """Saves an answer, dropping the oldest one when the cache is full."""
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
     
     def generate_response(self, user_input: str, model: str = DEFAULT_AI_MODEL) -> Dict[str, Any]:
         """Generates a response to the user's input."""
         start_time = time.time()
         self.total_requests += 1
         
-        # Try to get a response from Ollama
-        response, error = self._query_ollama(user_input, model)
+        # Answer straight from the cache when we've seen this prompt before
+        # Normalize once so "Hi", "hi" and "HI " share a cache slot
+        normalized = user_input.strip().casefold()
+        cache_key = self._cache_key(normalized, model)
+        response = self._get_cached_response(cache_key)
+        cache_hit = response is not None
         
-        # If Ollama fails, use a fallback response
-        if response is None:
-            response = self._create_fallback_response(user_input)
-            model_used = "fallback-response"
-        else:
+        if cache_hit:
             model_used = model
             error = None
+        else:
+            # Try to get a response from Ollama
+            response, error = self._query_ollama(user_input, model)
+            
+            # If Ollama fails, use a fallback response
+            if response is None:
+                response = self._create_fallback_response(user_input, normalized)
+                model_used = "fallback-response"
+            else:
+                model_used = model
+                error = None
+                self._store_cached_response(cache_key, response)
         
         time_taken = time.time() - start_time
         
@@ -120,90 +517,226 @@ class LocalAIHub:
             "model": model_used,
             "time_taken_seconds": round(time_taken, 3),
             "offline": True,
+            "cache_hit": cache_hit,
             "request_id": self.total_requests
         }
     
+    def stream_response(self, user_input: str, model: str = DEFAULT_AI_MODEL) -> Iterator[Dict[str, Any]]:
+        """Yields the response piece by piece, then a final summary event."""
+        start_time = time.time()
+        self.total_requests += 1
+        
+        # Normalize once so "Hi", "hi" and "HI " share a cache slot
+        normalized = user_input.strip().casefold()
+        cache_key = self._cache_key(normalized, model)
+        response = self._get_cached_response(cache_key)
+        cache_hit = response is not None
+        model_used = model
+        error = None
+        
+        if cache_hit:
+            yield {"response": response}
+        else:
+            parts = []
+            for piece, error in self._stream_ollama(user_input, model):
+                if piece is not None:
+                    parts.append(piece)
+                    yield {"response": piece}
+            
+            if parts:
+                response = "".join(parts)
+                if error is None:
+                    self._store_cached_response(cache_key, response)
+            else:
+                # Nothing came back from Ollama, so use a fallback response
+                response = self._create_fallback_response(user_input, normalized)
+                model_used = "fallback-response"
+                yield {"response": response}
+        
+        time_taken = time.time() - start_time
+        self._save_interaction(user_input, response, model_used, time_taken, error)
+        
+        summary = {
+            "done": True,
+            "model": model_used,
+            "time_taken_seconds": round(time_taken, 3),
+            "offline": True,
+            "cache_hit": cache_hit,
+            "request_id": self.total_requests
+        }
+        # Let the client know if Ollama stopped partway through
+        if error is not None and model_used != "fallback-response":
+            summary["error"] = error
+        yield summary
+    
     def get_system_status(self) -> Dict[str, Any]:
-        """Returns information about the system's status."""
+        """Returns information about the system's status, cached briefly."""
+        cached_at, cached = self._status_cache
+        if cached is not None and time.time() - cached_at < STATUS_CACHE_SECONDS:
+            return dict(cached)
+        
+        # Only one caller rebuilds the snapshot; the rest wait and reuse it
+        with self._status_lock:
+            now = time.time()
+            cached_at, cached = self._status_cache
+            if cached is None or now - cached_at >= STATUS_CACHE_SECONDS:
+                cached = self._build_system_status()
+                self._status_cache = (now, cached)
+            return dict(cached)
+    
+    def _build_system_status(self) -> Dict[str, Any]:
+        """Collects fresh information about the system's status."""
         uptime = time.time() - self.start_time
         memory = psutil.virtual_memory()
         
-        # Check if Ollama is running
-        ollama_running = False
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
-            ollama_running = response.status_code == 200
-        except:
-            pass
-        
         return {
             "status": "running",
             "uptime_seconds": round(uptime, 1),
             "requests_handled": self.total_requests,
             "memory_usage_percent": memory.percent,
             "memory_available_gb": round(memory.available / (1024**3), 2),
-            "ollama_running": ollama_running,
+            "ollama_running": self._ollama_up,
+            "cache_entries": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
             "log_file": str(LOG_FILE),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _iso_timestamp(time.time_ns())
         }
 
 # Start the AI hub
 ai_hub = LocalAIHub()
 
+# Error bodies for bad prompts, serialized once
+_EMPTY_REQUEST: Dict[str, Any] = {}
+_ERR_NO_PROMPT = orjson.dumps({"error": "Please include a 'prompt' in your request"})
+_ERR_EMPTY_PROMPT = orjson.dumps({"error": "Prompt cannot be empty"})
+
+def _to_valid_utf8(text: str) -> str:
+    """Replaces characters orjson can't encode, such as lone surrogates."""
+    try:
+        text.encode("utf-8")
+        return text
+    except UnicodeEncodeError:
+        return text.encode("utf-8", "replace").decode("utf-8")
+
+def _read_prompt() -> tuple[Optional[str], str, Optional[Response]]:
+    """Pulls the prompt and model from the request, or returns an error response."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = _EMPTY_REQUEST
+    
+    prompt = data.get('prompt')
+    if not isinstance(prompt, str):
+        return None, DEFAULT_AI_MODEL, fastjson(_ERR_NO_PROMPT, 400)
+    
+    user_input = _to_valid_utf8(prompt).strip()
+    if not user_input:
+        return None, DEFAULT_AI_MODEL, fastjson(_ERR_EMPTY_PROMPT, 400)
+    
+    model = data.get('model')
+    model = _to_valid_utf8(model) if isinstance(model, str) and model else DEFAULT_AI_MODEL
+    
+    return user_input, model, None
+
+def _to_event_stream(events: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """Formats each event as a server-sent event line."""
+    for event in events:
+        yield b"data: " + orjson.dumps(event) + b"\n\n"
+
 @app.route('/generate', methods=['POST'])
 def generate():
     """Handles user prompts and returns AI responses."""
     try:
-        data = request.get_json()
+        user_input, model, error_response = _read_prompt()
+        if error_response is not None:
+            return error_response
         
-        if not data or 'prompt' not in data:
-            return jsonify({"error": "Please include a 'prompt' in your request"}), 400
-        
-        user_input = data['prompt']
-        model = data.get('model', DEFAULT_AI_MODEL)
+        result = ai_hub.generate_response(user_input, model)
+        return fastjson(result)
         
-        if not user_input.strip():
-            return jsonify({"error": "Prompt cannot be empty"}), 400
+    except Exception as e:
+        return fastjson({"error": f"Something went wrong: {str(e)}"}, 500)
+
+@app.route('/generate/stream', methods=['POST'])
+def generate_stream():
+    """Streams the AI response back as it's generated."""
+    try:
+        user_input, model, error_response = _read_prompt()
+        if error_response is not None:
+            return error_response
         
-        result = ai_hub.generate_response(user_input, model)
-        return jsonify(result)
+        events = ai_hub.stream_response(user_input, model)
+        return Response(
+            stream_with_context(_to_event_stream(events)),
+            mimetype="text/event-stream"
+        )
         
     except Exception as e:
-        return jsonify({"error": f"Something went wrong: {str(e)}"}), 500
+        return fastjson({"error": f"Something went wrong: {str(e)}"}, 500)
 
 @app.route('/status', methods=['GET'])
 def status():
     """Shows system status and performance details."""
     try:
         status_info = ai_hub.get_system_status()
-        return jsonify(status_info)
+        return fastjson(status_info)
     except Exception as e:
-        return jsonify({"error": f"Could not fetch status: {str(e)}"}), 500
+        return fastjson({"error": f"Could not fetch status: {str(e)}"}, 500)
+
+def _build_health_body() -> bytes:
+    return orjson.dumps({"status": "healthy", "timestamp": _iso_timestamp(time.time_ns())})
+
+def _refresh_health_body():
+    """Keeps the /health timestamp current in the background."""
+    while True:
+        time.sleep(HEALTH_REFRESH_SECONDS)
+        _HEALTH_BODY[0] = _build_health_body()
+
+# /health is polled a lot, so its body is built ahead of time
+_HEALTH_BODY = [_build_health_body()]
+_HEALTH_HEADERS = {"Cache-Control": "no-store"}
+threading.Thread(target=_refresh_health_body, daemon=True).start()
 
 @app.route('/health', methods=['GET'])
 def health():
     """Quick check to confirm the server is running."""
-    return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()})
+    return app.response_class(_HEALTH_BODY[0], mimetype="application/json", headers=_HEALTH_HEADERS)
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "This endpoint doesn't exist"}), 404
+    return fastjson({"error": "This endpoint doesn't exist"}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({"error": "Something broke on our end"}), 500
+    return fastjson({"error": "Something broke on our end"}, 500)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="LocalAIHub Server")
+    parser.add_argument('--host', default='0.0.0.0', help='Address to listen on (default: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=5000, help='Port to listen on (default: 5000)')
+    parser.add_argument(
+        '--use-gevent',
+        action='store_true',
+        help='Serve with gevent so many requests can wait on Ollama at once (default: Flask dev server)'
+    )
+    args = parser.parse_args()
+    
     print("🌟 Starting LocalAIHub Server...")
     print(f"📝 Logs will be saved to: {LOG_FILE}")
     print("🔗 Available endpoints:")
     print("   POST /generate - Send a prompt to get an AI response")
+    print("   POST /generate/stream - Get the AI response as it's generated")
     print("   GET /status    - Check system status and stats")
     print("   GET /health    - Quick server health check")
     print("\n💡 Tip: Make sure Ollama is running with: ollama serve")
     
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=False
-    )
\ No newline at end of file
+    if args.use_gevent:
+        from gevent.pywsgi import WSGIServer
+        print(f"⚡ Serving with gevent on {args.host}:{args.port}")
+        WSGIServer((args.host, args.port), app).serve_forever()
+    else:
+        app.run(
+            host=args.host,
+            port=args.port,
+            debug=False
+        )
\ No newline at end of file
@@ -16,8 +16,12 @@ DEFAULT_API_URL = "http://localhost:5000"
 class LocalAIHubCLI:
     """A simple command-line tool to interact with your local AI server."""
     
-    def __init__(self, api_url: str = DEFAULT_API_URL):
+    def __init__(self, api_url: str = DEFAULT_API_URL, quiet: bool = False):
         self.api_url = api_url.rstrip('/')
+        self.quiet = quiet
+        # Reuse one connection to the server across chat turns
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
     
     def _send_request(self, endpoint: str, method: str = "GET", data: Optional[dict] = None) -> tuple[bool, dict]:
         """Sends a request to the LocalAIHub server."""
@@ -25,9 +29,9 @@ class LocalAIHubCLI:
         
         try:
             if method == "POST":
-                response = requests.post(url, json=data, timeout=30)
+                response = self.session.post(url, json=data, timeout=30)
             else:
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=10)
             
             return response.status_code == 200, response.json()
             
@@ -38,9 +42,16 @@ class LocalAIHubCLI:
         except Exception as e:
             return False, {"error": f"Something went wrong: {str(e)}"}
     
+    def _write(self, lines: list[str], stream=None) -> None:
+        """Prints several lines with a single write."""
+        stream = stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+    
     def ask_ai(self, user_input: str, model: str = "llama2") -> None:
         """Sends your question to the AI and prints the response."""
-        print(f"🤖 Sending your question to LocalAIHub...")
+        if not self.quiet:
+            self._write(["🤖 Sending your question to LocalAIHub..."])
         
         start_time = time.time()
         success, result = self._send_request("/generate", "POST", {
@@ -48,33 +59,46 @@ class LocalAIHubCLI:
             "model": model
         })
         
-        if success:
-            print(f"\n✅ Got a response (took {result.get('duration_seconds', time.time() - start_time):.2f}s):")
-            print(f"📝 Model used: {result.get('model', 'unknown')}")
-            print(f"🎯 AI says:\n{result.get('response', 'No response')}")
-            
-            if result.get('model') == 'fallback-response':
-                print("\n⚠️  Note: Using a backup response (Ollama isn't available)")
-        else:
-            print(f"\n❌ Oops: {result.get('error', 'Something went wrong')}")
+        if not success:
+            error = result.get('error', 'Something went wrong')
+            if self.quiet:
+                self._write([error], sys.stderr)
+            else:
+                self._write([f"\n❌ Oops: {error}"])
+            return
+        
+        if self.quiet:
+            self._write([result.get('response', 'No response')])
+            return
+        
+        lines = [
+            f"\n✅ Got a response (took {result.get('duration_seconds', time.time() - start_time):.2f}s):",
+            f"📝 Model used: {result.get('model', 'unknown')}",
+            f"🎯 AI says:\n{result.get('response', 'No response')}"
+        ]
+        if result.get('model') == 'fallback-response':
+            lines.append("\n⚠️  Note: Using a backup response (Ollama isn't available)")
+        self._write(lines)
     
     def check_status(self) -> None:
         """Shows the status of the LocalAIHub server."""
-        print("📊 Checking LocalAIHub status...")
+        self._write(["📊 Checking LocalAIHub status..."])
         
         success, result = self._send_request("/status")
         
         if success:
-            print("\n✅ LocalAIHub Status:")
-            print(f"🟢 Status: {result.get('status', 'unknown')}")
-            print(f"⏰ Running for: {result.get('uptime_seconds', 0):.1f} seconds")
-            print(f"📈 Questions answered: {result.get('requests_served', 0)}")
-            print(f"💾 Memory usage: {result.get('memory_usage_percent', 0):.1f}%")
-            print(f"💽 Free memory: {result.get('memory_available_gb', 0):.2f} GB")
-            print(f"🔗 Ollama running: {'✅ Yes' if result.get('ollama_available') else '❌ No'}")
-            print(f"📁 Logs saved to: {result.get('log_file', 'unknown')}")
+            self._write([
+                "\n✅ LocalAIHub Status:",
+                f"🟢 Status: {result.get('status', 'unknown')}",
+                f"⏰ Running for: {result.get('uptime_seconds', 0):.1f} seconds",
+                f"📈 Questions answered: {result.get('requests_served', 0)}",
+                f"💾 Memory usage: {result.get('memory_usage_percent', 0):.1f}%",
+                f"💽 Free memory: {result.get('memory_available_gb', 0):.2f} GB",
+                f"🔗 Ollama running: {'✅ Yes' if result.get('ollama_available') else '❌ No'}",
+                f"📁 Logs saved to: {result.get('log_file', 'unknown')}"
+            ])
         else:
-            print(f"\n❌ Oops: {result.get('error', 'Something went wrong')}")
+            self._write([f"\n❌ Oops: {result.get('error', 'Something went wrong')}"])
     
     def chat_mode(self) -> None:
         """Starts an interactive chat with the AI."""
@@ -111,6 +135,7 @@ Examples:
   %(prog)s status
   %(prog)s chat
   %(prog)s ask "Tell me about Python" --model llama2
+  %(prog)s --quiet ask "Summarize this" > answer.txt
         """
     )
     
@@ -119,6 +144,11 @@ Examples:
         default=DEFAULT_API_URL,
         help=f'Server URL (default: {DEFAULT_API_URL})'
     )
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help="Only print the AI's answer (handy for scripts)"
+    )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -139,7 +169,7 @@ Examples:
         parser.print_help()
         return
     
-    cli = LocalAIHubCLI(args.api_url)
+    cli = LocalAIHubCLI(args.api_url, quiet=args.quiet)
     
     try:
         if args.command == 'ask':
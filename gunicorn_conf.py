@@ -0,0 +1,20 @@
+"""
+Gunicorn settings for LocalAIHub
+Each worker is its own process with its own response cache, request counter
+and connection pool to Ollama. That keeps workers independent, but cached
+answers and /status numbers are per worker rather than server-wide.
+"""
+
+import os
+
+# Where to listen
+bind = os.environ.get("LOCALAIHUB_BIND", "0.0.0.0:5000")
+
+# gevent workers let each process wait on many Ollama calls at once
+worker_class = "gevent"
+workers = max(2, os.cpu_count() or 1)
+worker_connections = 1000
+
+# Keep client connections open between requests
+keepalive = 30
+timeout = 60
@@ -42,7 +42,7 @@ echo "✅ All set!"
 echo ""
 echo "🚀 Start the server with:"
 echo "   source venv/bin/activate"
-echo "   python app.py"
+echo "   python api.py"
 echo ""
 echo "🔧 Use the CLI with:"
 echo "   source venv/bin/activate"
@@ -6,14 +6,21 @@ Test script for LocalAIHub API
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 API_URL = "http://localhost:5000"
 
+# One shared session so the concurrent tests reuse connections to the server
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_maxsize=16))
+session.headers["Accept-Encoding"] = "gzip, deflate"
+
 def test_health():
     """Check if the server is up and running."""
     print("🔍 Checking server health...")
     try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
+        response = session.get(f"{API_URL}/health", timeout=5)
         print(f"✅ Server is healthy: {response.status_code} - {response.json()}")
         return response.status_code == 200
     except Exception as e:
@@ -24,7 +31,7 @@ def test_status():
     """Check the server's status and system info."""
     print("🔍 Checking server status...")
     try:
-        response = requests.get(f"{API_URL}/status", timeout=5)
+        response = session.get(f"{API_URL}/status", timeout=5)
         if response.status_code == 200:
             status = response.json()
             print("✅ Server status:")
@@ -39,8 +46,18 @@ def test_status():
         print(f"❌ Status check failed: {e}")
         return False
 
+def _ask(question):
+    """Sends one question and times how long the answer takes."""
+    start_time = time.time()
+    response = session.post(
+        f"{API_URL}/generate",
+        json={"prompt": question},
+        timeout=30
+    )
+    return response, time.time() - start_time
+
 def test_generate():
-    """Test sending questions to the AI."""
+    """Test sending questions to the AI, all at once."""
     print("🔍 Testing AI responses...")
     
     test_questions = [
@@ -51,28 +68,27 @@ def test_generate():
     
     success_count = 0
     
-    for question in test_questions:
-        try:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {}
+        for question in test_questions:
             print(f"   📝 Asking: '{question}'")
-            
-            start_time = time.time()
-            response = requests.post(
-                f"{API_URL}/generate",
-                json={"prompt": question},
-                timeout=30
-            )
-            duration = time.time() - start_time
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"   ✅ Got answer ({duration:.2f}s): {result.get('response', '')[:100]}...")
-                print(f"      Model used: {result.get('model', 'unknown')}")
-                success_count += 1
-            else:
-                print(f"   ❌ Failed: {response.status_code} - {response.text}")
+            futures[executor.submit(_ask, question)] = question
+        
+        for future in as_completed(futures):
+            question = futures[future]
+            try:
+                response, duration = future.result()
                 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+                if response.status_code == 200:
+                    result = response.json()
+                    print(f"   ✅ Got answer to '{question}' ({duration:.2f}s): {result.get('response', '')[:100]}...")
+                    print(f"      Model used: {result.get('model', 'unknown')}")
+                    success_count += 1
+                else:
+                    print(f"   ❌ Failed '{question}': {response.status_code} - {response.text}")
+                    
+            except Exception as e:
+                print(f"   ❌ Error on '{question}': {e}")
     
     print(f"📊 AI response tests: {success_count}/{len(test_questions)} passed")
     return success_count == len(test_questions)
@@ -81,35 +97,26 @@ def test_error_handling():
     """Test how the server handles bad inputs."""
     print("🔍 Testing error handling...")
     
-    # Test empty question
-    try:
-        response = requests.post(f"{API_URL}/generate", json={"prompt": ""}, timeout=5)
-        if response.status_code == 400:
-            print("✅ Empty question caught correctly")
-        else:
-            print(f"❌ Empty question not caught: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Empty question test failed: {e}")
-    
-    # Test missing question
-    try:
-        response = requests.post(f"{API_URL}/generate", json={}, timeout=5)
-        if response.status_code == 400:
-            print("✅ Missing question caught correctly")
-        else:
-            print(f"❌ Missing question not caught: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Missing question test failed: {e}")
+    # Each check: (name, how to send it, status code we expect)
+    checks = [
+        ("Empty question", lambda: session.post(f"{API_URL}/generate", json={"prompt": ""}, timeout=5), 400),
+        ("Missing question", lambda: session.post(f"{API_URL}/generate", json={}, timeout=5), 400),
+        ("Wrong endpoint", lambda: session.get(f"{API_URL}/invalid", timeout=5), 404),
+    ]
     
-    # Test wrong endpoint
-    try:
-        response = requests.get(f"{API_URL}/invalid", timeout=5)
-        if response.status_code == 404:
-            print("✅ Wrong endpoint caught correctly")
-        else:
-            print(f"❌ Wrong endpoint not caught: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Wrong endpoint test failed: {e}")
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(send): (name, expected) for name, send, expected in checks}
+        
+        for future in as_completed(futures):
+            name, expected = futures[future]
+            try:
+                response = future.result()
+                if response.status_code == expected:
+                    print(f"✅ {name} caught correctly")
+                else:
+                    print(f"❌ {name} not caught: {response.status_code}")
+            except Exception as e:
+                print(f"❌ {name} test failed: {e}")
 
 def main():
     """Run all LocalAIHub tests."""
@@ -118,7 +125,7 @@ def main():
     
     # Check if the server is running
     if not test_health():
-        print("\n❌ Server isn't running. Start it with: python app.py")
+        print("\n❌ Server isn't running. Start it with: python api.py")
         return
     
     print()
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+LocalAIHub WSGI entry point
+Run with: gunicorn -c gunicorn_conf.py wsgi:application
+"""
+
+from api import app
+
+application = app